@@ -1,11 +1,24 @@
+import asyncio
+import httpx
+import ijson
+import orjson
 import requests
-from datetime import datetime, timedelta
-import pandas as pd
+import requests_cache
+from datetime import datetime
+import csv
+import functools
+import io
+import itertools
 import os
 import logging
+import random
+import sqlite3
 import time
 import argparse
-from typing import Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Tuple
+from urllib.parse import parse_qs, urlparse
+from requests.adapters import HTTPAdapter
 from requests.exceptions import HTTPError, RequestException
 
 def setup_argparse() -> argparse.ArgumentParser:
@@ -38,9 +51,8 @@ def setup_logging(log_level: str, output_dir: str) -> None:
         log_level (str): Desired logging level
         output_dir (str): Directory for log files
     """
-    if not os.path.exists(output_dir):
-        os.makedirs(output_dir)
-        
+    os.makedirs(output_dir, exist_ok=True)
+
     log_file = os.path.join(output_dir, f'github_metrics_{datetime.now().strftime("%Y%m%d_%H%M%S")}.log')
     
     logging.basicConfig(
@@ -59,23 +71,159 @@ class RateLimitError(Exception):
         self.reset_time = reset_time
         super().__init__(f"Rate limit exceeded. Resets at {datetime.fromtimestamp(reset_time)}")
 
+# In-memory cache TTLs per endpoint, in seconds. Traffic data only changes
+# daily, so it can be held much longer than star/fork counts.
+_BASIC_METRICS_TTL = 300
+_TRAFFIC_TTL = 3600
+_FORKS_TTL = 600
+
+def _ttl_cache(ttl: int):
+    """
+    Cache a collector method's result in memory for ttl seconds.
+
+    Entries live on the collector instance, keyed by the method's positional
+    arguments, so repeated calls for the same repo within the TTL become dict
+    lookups and consume no API quota.
+    """
+    def decorator(func):
+        cache_attr = f'_cache_{func.__name__}'
+
+        @functools.wraps(func)
+        def wrapper(self, *args):
+            cache = self.__dict__.setdefault(cache_attr, {})
+            now = time.time()
+            hit = cache.get(args)
+            if hit is not None and now - hit[0] < ttl:
+                return hit[1]
+            value = func(self, *args)
+            cache[args] = (now, value)
+            return value
+        return wrapper
+    return decorator
+
+# Everything collect_all_metrics needs outside the traffic endpoints, fetched
+# in a single round trip instead of one request per REST endpoint. Fork pages
+# beyond the first 100 are followed via the cursor in $forkCursor.
+_METRICS_QUERY = """
+query RepoMetrics($owner: String!, $repo: String!, $forkCursor: String) {
+  repository(owner: $owner, name: $repo) {
+    stargazerCount
+    forkCount
+    watchers { totalCount }
+    issues(states: OPEN) { totalCount }
+    updatedAt
+    forks(first: 100, after: $forkCursor) {
+      pageInfo { hasNextPage endCursor }
+      nodes {
+        owner { login }
+        createdAt
+        updatedAt
+        stargazerCount
+      }
+    }
+  }
+}
+"""
+
+def _fork_node_record(node: Dict) -> Dict:
+    """Project a GraphQL fork node down to the fields OctoLens exports."""
+    return {
+        'owner': node['owner']['login'],
+        'created_at': node['createdAt'],
+        'last_updated': node['updatedAt'],
+        'stars': node['stargazerCount']
+    }
+
+def _parse_graphql_metrics(repository: Dict, fork_details: List[Dict]) -> Dict:
+    """Map a GraphQL repository payload onto the REST metrics dict shape."""
+    return {
+        'stars': repository['stargazerCount'],
+        'forks': repository['forkCount'],
+        'watchers': repository['watchers']['totalCount'],
+        'open_issues': repository['issues']['totalCount'],
+        'last_updated': repository['updatedAt'],
+        'fork_count': repository['forkCount'],
+        'fork_details': fork_details
+    }
+
+def _fork_record(fork: Dict) -> Dict:
+    """Project a full fork object down to the fields OctoLens exports."""
+    return {
+        'owner': fork['owner']['login'],
+        'created_at': fork['created_at'],
+        'last_updated': fork['updated_at'],
+        'stars': fork['stargazers_count']
+    }
+
+def _last_page(response) -> int:
+    """
+    Extract the last page number from a paginated response's Link header.
+
+    Works for both requests and httpx responses; returns 1 when there is
+    no rel="last" link (i.e. a single page of results).
+    """
+    last = response.links.get('last')
+    if not last:
+        return 1
+    return int(parse_qs(urlparse(last['url']).query)['page'][0])
+
+def _rate_limit_wait(response):
+    """
+    Determine how long a rate-limited response asks us to wait, in seconds.
+
+    Secondary (abuse) limits answer 403/429 with a Retry-After header that
+    should be honored as-is; primary limits expose the end of the current
+    window in X-RateLimit-Reset. Returns None when the response is not
+    rate-limit related (e.g. an ordinary 403 Forbidden).
+    """
+    if response.status_code not in (403, 429):
+        return None
+    retry_after = response.headers.get('Retry-After')
+    if retry_after is not None:
+        return float(retry_after) + 1
+    if response.headers.get('X-RateLimit-Remaining') == '0':
+        reset_time = int(response.headers.get('X-RateLimit-Reset', 0))
+        return max(reset_time - time.time(), 0) + 1
+    return None
+
 class GitHubMetricsCollector:
-    def __init__(self, token: str, max_retries: int = 3, retry_delay: int = 5):
+    def __init__(self, token: str, max_retries: int = 3, retry_delay: int = 5,
+                 max_concurrency: int = 5):
         """
         Initialize the collector with your GitHub personal access token.
-        
+
         Args:
             token (str): GitHub personal access token
             max_retries (int): Maximum number of retries for rate-limited requests
             retry_delay (int): Base delay between retries in seconds
+            max_concurrency (int): Maximum number of paginated requests in flight
         """
         self.headers = {
             'Authorization': f'token {token}',
-            'Accept': 'application/vnd.github.v3+json'
+            'Accept': 'application/vnd.github.v3+json',
+            'Accept-Encoding': 'gzip, deflate, br'
         }
         self.base_url = 'https://api.github.com'
         self.max_retries = max_retries
         self.retry_delay = retry_delay
+        self.max_concurrency = max_concurrency
+        # On-disk HTTP cache with ETag/Last-Modified revalidation. Warm hits
+        # are served locally, and 304 revalidations don't count against the
+        # GitHub rate limit. Pagination is safe: entries are keyed by the full
+        # URL, including query parameters such as ?page=.
+        self.session = requests_cache.CachedSession(
+            'github_cache',
+            backend='sqlite',
+            expire_after=180,
+            cache_control=True,
+            stale_if_error=True,
+            always_revalidate=True
+        )
+        self.session.headers.update(self.headers)
+        # Keep-alive connection pool: reusing TCP+TLS connections saves a
+        # handshake and ~1 RTT on every request after the first.
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=0)
+        self.session.mount('https://', adapter)
 
     def _make_request(self, url: str, method: str = 'GET', **kwargs) -> requests.Response:
         """
@@ -97,26 +245,28 @@ class GitHubMetricsCollector:
         retries = 0
         while retries <= self.max_retries:
             try:
-                response = requests.request(method, url, headers=self.headers, **kwargs)
+                response = self.session.request(method, url, **kwargs)
                 
                 # Log remaining rate limit
                 remaining = response.headers.get('X-RateLimit-Remaining', 'N/A')
                 reset_time = response.headers.get('X-RateLimit-Reset', 'N/A')
-                logger.debug(f"Rate limit remaining: {remaining}, Reset time: {reset_time}")
+                logger.debug("Rate limit remaining: %s, Reset time: %s", remaining, reset_time)
+                logger.debug("Content-Encoding: %s", response.headers.get('Content-Encoding', 'identity'))
                 
-                # Handle rate limit error
-                if response.status_code == 403 and 'X-RateLimit-Remaining' in response.headers:
-                    reset_time = int(response.headers['X-RateLimit-Reset'])
-                    wait_time = reset_time - time.time()
-                    
-                    if wait_time > 0 and retries < self.max_retries:
-                        wait_time = min(wait_time + 1, 3600)  # Cap wait time at 1 hour
-                        logger.warning(f"Rate limit hit. Waiting {wait_time:.0f} seconds. Retry {retries + 1}/{self.max_retries}")
+                # Handle primary and secondary rate limit errors
+                wait_time = _rate_limit_wait(response)
+                if wait_time is not None:
+                    if retries < self.max_retries:
+                        # Cap at 1 hour; add up to 10% jitter so multiple instances
+                        # don't all wake exactly at the reset time
+                        wait_time = min(wait_time, 3600) * random.uniform(1.0, 1.1)
+                        limit_kind = 'Secondary rate' if 'Retry-After' in response.headers else 'Rate'
+                        logger.warning("%s limit hit. Waiting %.0f seconds. Retry %d/%d", limit_kind, wait_time, retries + 1, self.max_retries)
                         time.sleep(wait_time)
                         retries += 1
                         continue
                     else:
-                        raise RateLimitError(reset_time)
+                        raise RateLimitError(int(response.headers.get('X-RateLimit-Reset', time.time() + wait_time)))
                 
                 # Handle other errors
                 response.raise_for_status()
@@ -124,30 +274,37 @@ class GitHubMetricsCollector:
                 
             except RequestException as e:
                 if retries < self.max_retries:
-                    wait_time = self.retry_delay * (2 ** retries)  # Exponential backoff
-                    logger.warning(f"Request failed: {e}. Retrying in {wait_time} seconds. Retry {retries + 1}/{self.max_retries}")
+                    # Exponential backoff with full jitter so concurrent workers
+                    # spread their retries instead of colliding again
+                    wait_time = min(random.uniform(0, self.retry_delay * (2 ** retries)), 60)
+                    logger.warning("Request failed: %s. Retrying in %s seconds. Retry %d/%d", e, wait_time, retries + 1, self.max_retries)
                     time.sleep(wait_time)
                     retries += 1
                 else:
-                    logger.error(f"Request failed after {self.max_retries} retries: {e}")
+                    logger.error("Request failed after %d retries: %s", self.max_retries, e)
                     raise
                     
         raise Exception("Maximum retries exceeded")
 
+    def _get_json(self, url: str, **kwargs):
+        """Fetch a URL and return its decoded JSON body."""
+        response = self._make_request(url, **kwargs)
+        return orjson.loads(response.content)
+
+    @_ttl_cache(_BASIC_METRICS_TTL)
     def get_repo_basic_metrics(self, owner: str, repo: str) -> Dict:
         """
         Get basic repository metrics like stars, forks, and watchers.
-        
+
         Args:
             owner (str): Repository owner
             repo (str): Repository name
-            
+
         Returns:
             Dict: Repository metrics
         """
         url = f'{self.base_url}/repos/{owner}/{repo}'
-        response = self._make_request(url)
-        data = response.json()
+        data = self._get_json(url)
         
         return {
             'stars': data['stargazers_count'],
@@ -157,6 +314,7 @@ class GitHubMetricsCollector:
             'last_updated': data['updated_at']
         }
 
+    @_ttl_cache(_TRAFFIC_TTL)
     def get_traffic_data(self, owner: str, repo: str) -> Dict:
         """
         Get repository traffic data for the last 14 days.
@@ -173,15 +331,13 @@ class GitHubMetricsCollector:
         clones_url = f'{self.base_url}/repos/{owner}/{repo}/traffic/clones'
         
         try:
-            views_response = self._make_request(views_url)
-            views_data = views_response.json()
+            views_data = self._get_json(views_url)
         except HTTPError as e:
             logger.warning(f"Could not fetch view data: {e}")
             views_data = {'count': 0, 'uniques': 0}
-            
+
         try:
-            clones_response = self._make_request(clones_url)
-            clones_data = clones_response.json()
+            clones_data = self._get_json(clones_url)
         except HTTPError as e:
             logger.warning(f"Could not fetch clone data: {e}")
             clones_data = {'count': 0, 'uniques': 0}
@@ -193,46 +349,119 @@ class GitHubMetricsCollector:
             'unique_cloners': clones_data.get('uniques', 0)
         }
 
+    def _stream_fork_page(self, response: requests.Response) -> List[Dict]:
+        """
+        Incrementally parse a /forks response, projecting each fork as it is
+        decoded. Full fork objects carry ~80 fields we never read; ijson never
+        materializes the parsed page, so beyond the body bytes only the
+        projected records are held in memory. The body is read whole rather
+        than streamed off the socket: the caching session owns the raw stream
+        (it copies and re-encodes it for the cache), so raw reads are not
+        safe here.
+        """
+        with response:
+            return [_fork_record(fork) for fork in ijson.items(io.BytesIO(response.content), 'item')]
+
+    @_ttl_cache(_FORKS_TTL)
     def get_fork_details(self, owner: str, repo: str) -> List[Dict]:
         """
-        Get detailed information about repository forks.
-        
+        Get detailed information about all repository forks.
+
+        Fetches 100 forks per page (the API maximum) and, when more pages
+        exist, retrieves the remaining pages in parallel. Pages are parsed
+        incrementally so only the projected fields are kept in memory.
+
         Args:
             owner (str): Repository owner
             repo (str): Repository name
-            
+
         Returns:
             List[Dict]: List of fork details
         """
         url = f'{self.base_url}/repos/{owner}/{repo}/forks'
-        response = self._make_request(url)
-        forks = response.json()
-        
-        return [{
-            'owner': fork['owner']['login'],
-            'created_at': fork['created_at'],
-            'last_updated': fork['updated_at'],
-            'stars': fork['stargazers_count']
-        } for fork in forks]
+        response = self._make_request(url, params={'per_page': 100, 'page': 1})
+        last_page = _last_page(response)
+        forks = self._stream_fork_page(response)
+
+        if last_page > 1:
+            def fetch_page(page: int) -> List[Dict]:
+                return self._stream_fork_page(
+                    self._make_request(url, params={'per_page': 100, 'page': page})
+                )
+
+            with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+                forks = list(itertools.chain(forks, *executor.map(fetch_page, range(2, last_page + 1))))
+
+        return forks
+
+    @_ttl_cache(_BASIC_METRICS_TTL)
+    def get_metrics_graphql(self, owner: str, repo: str) -> Dict:
+        """
+        Get basic metrics and fork details in a single GraphQL request.
+
+        Requests only the fields OctoLens exports, so one round trip (and one
+        rate-limit point) replaces the separate repo and forks REST calls.
+        Traffic data has no GraphQL equivalent and still comes from
+        get_traffic_data.
+
+        Args:
+            owner (str): Repository owner
+            repo (str): Repository name
+
+        Returns:
+            Dict: Basic metrics plus fork_count/fork_details, in the same
+                shape collect_all_metrics produces for those keys
+        """
+        url = f'{self.base_url}/graphql'
+        fork_details: List[Dict] = []
+        cursor = None
+
+        while True:
+            response = self._make_request(url, method='POST', json={
+                'query': _METRICS_QUERY,
+                'variables': {'owner': owner, 'repo': repo, 'forkCursor': cursor}
+            })
+            payload = orjson.loads(response.content)
+            if 'errors' in payload:
+                raise RuntimeError(f"GraphQL query failed: {payload['errors']}")
+
+            repository = payload['data']['repository']
+            fork_page = repository['forks']
+            fork_details.extend(_fork_node_record(node) for node in fork_page['nodes'])
+            if not fork_page['pageInfo']['hasNextPage']:
+                break
+            cursor = fork_page['pageInfo']['endCursor']
+
+        return _parse_graphql_metrics(repository, fork_details)
 
     def collect_all_metrics(self, owner: str, repo: str) -> Dict:
         """
         Collect all available metrics for a repository.
-        
+
+        The three endpoint groups are independent, so they are fetched in
+        parallel — requests releases the GIL around socket I/O, so wall time
+        is roughly the slowest group instead of the sum. The session and its
+        connection pool are thread-safe and sized above the worker count.
+
         Args:
             owner (str): Repository owner
             repo (str): Repository name
-            
+
         Returns:
             Dict: All repository metrics combined
         """
         logger.info(f"Collecting all metrics for {owner}/{repo}")
-        
+
         try:
-            basic_metrics = self.get_repo_basic_metrics(owner, repo)
-            traffic_data = self.get_traffic_data(owner, repo)
-            fork_data = self.get_fork_details(owner, repo)
-            
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                basic_future = executor.submit(self.get_repo_basic_metrics, owner, repo)
+                traffic_future = executor.submit(self.get_traffic_data, owner, repo)
+                fork_future = executor.submit(self.get_fork_details, owner, repo)
+
+                basic_metrics = basic_future.result()
+                traffic_data = traffic_future.result()
+                fork_data = fork_future.result()
+
             return {
                 'timestamp': datetime.now().isoformat(),
                 'repository': f'{owner}/{repo}',
@@ -245,61 +474,78 @@ class GitHubMetricsCollector:
             logger.error(f"Error collecting metrics: {e}", exc_info=True)
             raise
 
+    def warm(self, repos: List[Tuple[str, str]]) -> None:
+        """
+        Prefetch metrics for the given repositories to prime the caches.
+
+        Useful at startup for dashboard-style callers: subsequent
+        collect_all_metrics calls within the TTLs are served from memory.
+
+        Args:
+            repos (List[Tuple[str, str]]): (owner, repo) pairs to prefetch
+        """
+        for owner, repo in repos:
+            try:
+                self.collect_all_metrics(owner, repo)
+            except Exception as e:
+                logger.warning(f"Could not warm cache for {owner}/{repo}: {e}")
+
     @staticmethod
-    def _generate_filename(base_name: str, format: str) -> str:
+    def _generate_filename(base_name: str, format: str, timestamp: str = None) -> str:
         """
         Generate a filename with timestamp.
         
         Args:
             base_name (str): Base name for the file
             format (str): File format (e.g., 'csv', 'json')
-            
+            timestamp (str): Timestamp string to embed; defaults to now
+
         Returns:
             str: Filename with timestamp
         """
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        if timestamp is None:
+            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         return f"{base_name}_{timestamp}.{format}"
 
     @staticmethod
-    def export_data(data: Dict, output_dir: str, base_name: str, format: str = 'csv') -> None:
+    def export_data(data: Dict, output_dir: str, base_name: str, format: str = 'csv',
+                    timestamp: str = None) -> None:
         """
         Export data to a file in the specified format.
-        
+
         Args:
             data (Dict): Data to export
             output_dir (str): Directory for output files
             base_name (str): Base name for output file (timestamp will be added)
             format (str): Export format ('csv' or 'json')
+            timestamp (str): Timestamp for the filename; pass the same value
+                for multiple formats of one run so the names match
         """
         # Create output directory if it doesn't exist
-        if not os.path.exists(output_dir):
-            os.makedirs(output_dir)
-            
+        os.makedirs(output_dir, exist_ok=True)
+
         # Generate filename with timestamp
         filename = os.path.join(
             output_dir,
-            GitHubMetricsCollector._generate_filename(base_name, format)
+            GitHubMetricsCollector._generate_filename(base_name, format, timestamp)
         )
         
         logger.info(f"Exporting data to {filename}")
         
         try:
-            # Create a copy of data for export
-            export_data = data.copy()
-            
-            # Handle nested fork_details for CSV export
             if format.lower() == 'csv':
+                # Flatten nested fork_details into a single CSV cell
+                export_data = data.copy()
                 export_data['fork_details'] = str(export_data.get('fork_details', []))
-            
-            df = pd.DataFrame([export_data])
-            
-            if format.lower() == 'csv':
-                df.to_csv(filename, index=False)
+
+                with open(filename, 'w', newline='') as f:
+                    writer = csv.DictWriter(f, fieldnames=list(export_data.keys()))
+                    writer.writeheader()
+                    writer.writerow(export_data)
             elif format.lower() == 'json':
                 # For JSON, keep the original nested structure
-                import json
-                with open(filename, 'w') as f:
-                    json.dump(data, f, indent=2, default=str)
+                with open(filename, 'wb') as f:
+                    f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2, default=str))
             else:
                 raise ValueError(f"Unsupported export format: {format}")
                 
@@ -308,6 +554,310 @@ class GitHubMetricsCollector:
             logger.error(f"Error exporting data: {e}", exc_info=True)
             raise
 
+class _ETagStore:
+    """
+    Persistent ETag + body store for conditional requests, keyed by URL.
+
+    GitHub does not count 304 Not Modified responses against the primary rate
+    limit, so replaying If-None-Match on every GET makes polling an unchanged
+    endpoint effectively free. The async collector uses this store; the sync
+    collector gets the same behavior from requests-cache.
+    """
+
+    def __init__(self, path: str = 'github_etags.sqlite'):
+        self._conn = sqlite3.connect(path)
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS etags '
+            '(url TEXT PRIMARY KEY, etag TEXT, headers TEXT, body BLOB)'
+        )
+        # Migrate stores created before headers were persisted
+        columns = [row[1] for row in self._conn.execute('PRAGMA table_info(etags)')]
+        if 'headers' not in columns:
+            self._conn.execute('ALTER TABLE etags ADD COLUMN headers TEXT')
+        self._conn.commit()
+
+    def get(self, url: str):
+        """Return the stored (etag, headers, body) triple for a URL, or None."""
+        row = self._conn.execute(
+            'SELECT etag, headers, body FROM etags WHERE url = ?', (url,)
+        ).fetchone()
+        if row is None:
+            return None
+        etag, headers, body = row
+        return etag, orjson.loads(headers) if headers else {}, body
+
+    def put(self, url: str, etag: str, headers: Dict, body: bytes) -> None:
+        """Store the ETag, headers, and body from a fresh 200 response."""
+        self._conn.execute(
+            'INSERT OR REPLACE INTO etags (url, etag, headers, body) VALUES (?, ?, ?, ?)',
+            (url, etag, orjson.dumps(headers).decode(), body)
+        )
+        self._conn.commit()
+
+    def close(self) -> None:
+        self._conn.close()
+
+class AsyncGitHubMetricsCollector:
+    def __init__(self, token: str, max_retries: int = 3, retry_delay: int = 5,
+                 max_concurrency: int = 5):
+        """
+        Async variant of GitHubMetricsCollector built on httpx.AsyncClient.
+
+        All independent endpoints are fetched concurrently, so collecting
+        metrics takes roughly the latency of the slowest request instead of
+        the sum of all of them.
+
+        Args:
+            token (str): GitHub personal access token
+            max_retries (int): Maximum number of retries for rate-limited requests
+            retry_delay (int): Base delay between retries in seconds
+            max_concurrency (int): Maximum number of paginated requests in flight
+        """
+        self.headers = {
+            'Authorization': f'token {token}',
+            'Accept': 'application/vnd.github.v3+json',
+            'Accept-Encoding': 'gzip, deflate, br'
+        }
+        self.base_url = 'https://api.github.com'
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self.max_concurrency = max_concurrency
+        # HTTP/2 multiplexes all concurrent requests over one TLS connection,
+        # so N parallel calls cost a single handshake instead of up to N.
+        self.client = httpx.AsyncClient(headers=self.headers, timeout=30.0, http2=True)
+        self._etag_store = _ETagStore()
+
+    async def __aenter__(self) -> 'AsyncGitHubMetricsCollector':
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP client and the ETag store."""
+        await self.client.aclose()
+        self._etag_store.close()
+
+    async def _make_request(self, url: str, method: str = 'GET', **kwargs) -> httpx.Response:
+        """
+        Make a request to the GitHub API with rate limit handling and retries.
+
+        Same semantics as GitHubMetricsCollector._make_request, but awaitable
+        so concurrent requests can overlap their waits.
+
+        Args:
+            url (str): The API endpoint URL
+            method (str): HTTP method (default: 'GET')
+            **kwargs: Additional arguments to pass to httpx
+
+        Returns:
+            httpx.Response: The API response
+
+        Raises:
+            RateLimitError: If rate limit is exceeded and max retries are exhausted
+            httpx.HTTPStatusError: For other HTTP errors
+            httpx.HTTPError: For network/connection errors
+        """
+        retries = 0
+        while retries <= self.max_retries:
+            try:
+                request = self.client.build_request(method, url, **kwargs)
+                cache_key = str(request.url)
+                cached = self._etag_store.get(cache_key) if method == 'GET' else None
+                if cached is not None:
+                    request.headers['If-None-Match'] = cached[0]
+                response = await self.client.send(request)
+
+                # Log remaining rate limit
+                remaining = response.headers.get('X-RateLimit-Remaining', 'N/A')
+                reset_time = response.headers.get('X-RateLimit-Reset', 'N/A')
+                logger.debug("Rate limit remaining: %s, Reset time: %s", remaining, reset_time)
+                logger.debug("Content-Encoding: %s", response.headers.get('Content-Encoding', 'identity'))
+
+                # 304 doesn't count against the rate limit; replay the stored
+                # response. A 304 need not repeat headers like Link, so merge
+                # the original 200's headers under the 304's fresher ones.
+                if response.status_code == 304 and cached is not None:
+                    logger.debug("304 Not Modified for %s; reusing stored response", cache_key)
+                    headers = {**cached[1], **dict(response.headers)}
+                    headers = {k: v for k, v in headers.items()
+                               if k.lower() not in ('content-length', 'content-encoding', 'transfer-encoding')}
+                    return httpx.Response(200, headers=headers, content=cached[2], request=request)
+
+                # Handle primary and secondary rate limit errors
+                wait_time = _rate_limit_wait(response)
+                if wait_time is not None:
+                    if retries < self.max_retries:
+                        # Cap at 1 hour; add up to 10% jitter so multiple instances
+                        # don't all wake exactly at the reset time
+                        wait_time = min(wait_time, 3600) * random.uniform(1.0, 1.1)
+                        limit_kind = 'Secondary rate' if 'Retry-After' in response.headers else 'Rate'
+                        logger.warning("%s limit hit. Waiting %.0f seconds. Retry %d/%d", limit_kind, wait_time, retries + 1, self.max_retries)
+                        await asyncio.sleep(wait_time)
+                        retries += 1
+                        continue
+                    else:
+                        raise RateLimitError(int(response.headers.get('X-RateLimit-Reset', time.time() + wait_time)))
+
+                # Handle other errors
+                response.raise_for_status()
+
+                etag = response.headers.get('ETag')
+                if method == 'GET' and etag:
+                    self._etag_store.put(cache_key, etag, dict(response.headers), response.content)
+                return response
+
+            except httpx.HTTPStatusError:
+                raise
+            except httpx.HTTPError as e:
+                if retries < self.max_retries:
+                    # Exponential backoff with full jitter so concurrent workers
+                    # spread their retries instead of colliding again
+                    wait_time = min(random.uniform(0, self.retry_delay * (2 ** retries)), 60)
+                    logger.warning("Request failed: %s. Retrying in %s seconds. Retry %d/%d", e, wait_time, retries + 1, self.max_retries)
+                    await asyncio.sleep(wait_time)
+                    retries += 1
+                else:
+                    logger.error("Request failed after %d retries: %s", self.max_retries, e)
+                    raise
+
+        raise Exception("Maximum retries exceeded")
+
+    async def _get_json(self, url: str, **kwargs):
+        """Fetch a URL and return its decoded JSON body."""
+        response = await self._make_request(url, **kwargs)
+        return orjson.loads(response.content)
+
+    async def get_fork_details(self, owner: str, repo: str) -> List[Dict]:
+        """
+        Get detailed information about all repository forks.
+
+        Fetches 100 forks per page (the API maximum) and retrieves any
+        remaining pages concurrently, bounded by max_concurrency.
+
+        Args:
+            owner (str): Repository owner
+            repo (str): Repository name
+
+        Returns:
+            List[Dict]: List of fork details
+        """
+        url = f'{self.base_url}/repos/{owner}/{repo}/forks'
+        response = await self._make_request(url, params={'per_page': 100, 'page': 1})
+        forks = orjson.loads(response.content)
+
+        last_page = _last_page(response)
+        if last_page > 1:
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+
+            async def fetch_page(page: int) -> List[Dict]:
+                async with semaphore:
+                    return await self._get_json(url, params={'per_page': 100, 'page': page})
+
+            pages = await asyncio.gather(*(fetch_page(page) for page in range(2, last_page + 1)))
+            forks = list(itertools.chain(forks, *pages))
+
+        return [_fork_record(fork) for fork in forks]
+
+    async def get_metrics_graphql(self, owner: str, repo: str) -> Dict:
+        """
+        Get basic metrics and fork details in a single GraphQL request.
+
+        Async counterpart of GitHubMetricsCollector.get_metrics_graphql; see
+        there for details.
+
+        Args:
+            owner (str): Repository owner
+            repo (str): Repository name
+
+        Returns:
+            Dict: Basic metrics plus fork_count/fork_details, in the same
+                shape collect_all_metrics produces for those keys
+        """
+        url = f'{self.base_url}/graphql'
+        fork_details: List[Dict] = []
+        cursor = None
+
+        while True:
+            response = await self._make_request(url, method='POST', json={
+                'query': _METRICS_QUERY,
+                'variables': {'owner': owner, 'repo': repo, 'forkCursor': cursor}
+            })
+            payload = orjson.loads(response.content)
+            if 'errors' in payload:
+                raise RuntimeError(f"GraphQL query failed: {payload['errors']}")
+
+            repository = payload['data']['repository']
+            fork_page = repository['forks']
+            fork_details.extend(_fork_node_record(node) for node in fork_page['nodes'])
+            if not fork_page['pageInfo']['hasNextPage']:
+                break
+            cursor = fork_page['pageInfo']['endCursor']
+
+        return _parse_graphql_metrics(repository, fork_details)
+
+    async def collect_all_metrics(self, owner: str, repo: str) -> Dict:
+        """
+        Collect all available metrics for a repository concurrently.
+
+        Basic metrics and fork details come from a single GraphQL request,
+        fetched alongside the two traffic endpoints (which have no GraphQL
+        equivalent). Traffic endpoints require push access, so their failures
+        are tolerated and reported as zero counts, matching the sync
+        collector.
+
+        Args:
+            owner (str): Repository owner
+            repo (str): Repository name
+
+        Returns:
+            Dict: All repository metrics combined
+        """
+        logger.info(f"Collecting all metrics for {owner}/{repo}")
+
+        views_url = f'{self.base_url}/repos/{owner}/{repo}/traffic/views'
+        clones_url = f'{self.base_url}/repos/{owner}/{repo}/traffic/clones'
+
+        metrics, views, clones = await asyncio.gather(
+            self.get_metrics_graphql(owner, repo),
+            self._get_json(views_url),
+            self._get_json(clones_url),
+            return_exceptions=True
+        )
+
+        # Basic metrics and fork details are required; re-raise their failures.
+        if isinstance(metrics, BaseException):
+            logger.error(f"Error collecting metrics: {metrics}", exc_info=metrics)
+            raise metrics
+
+        if isinstance(views, BaseException):
+            logger.warning(f"Could not fetch view data: {views}")
+            views = {'count': 0, 'uniques': 0}
+        if isinstance(clones, BaseException):
+            logger.warning(f"Could not fetch clone data: {clones}")
+            clones = {'count': 0, 'uniques': 0}
+
+        return {
+            'timestamp': datetime.now().isoformat(),
+            'repository': f'{owner}/{repo}',
+            'stars': metrics['stars'],
+            'forks': metrics['forks'],
+            'watchers': metrics['watchers'],
+            'open_issues': metrics['open_issues'],
+            'last_updated': metrics['last_updated'],
+            'total_views': views.get('count', 0),
+            'unique_visitors': views.get('uniques', 0),
+            'total_clones': clones.get('count', 0),
+            'unique_cloners': clones.get('uniques', 0),
+            'fork_count': metrics['fork_count'],
+            'fork_details': metrics['fork_details']
+        }
+
+async def _collect_metrics_async(token: str, owner: str, repo: str) -> Dict:
+    """Collect metrics with the async collector, closing the client afterwards."""
+    async with AsyncGitHubMetricsCollector(token) as collector:
+        return await collector.collect_all_metrics(owner, repo)
+
 def main():
     # Parse command-line arguments
     parser = setup_argparse()
@@ -330,23 +880,24 @@ def main():
     if not repo:
         raise ValueError("Please set GITHUB_REPO environment variable")
     
-    # Initialize collector
-    collector = GitHubMetricsCollector(token)
-    
     try:
-        # Collect all metrics
+        # Collect all metrics concurrently
         logger.info("Starting metrics collection")
-        metrics = collector.collect_all_metrics(owner, repo)
-        
-        # Export based on specified format
+        metrics = asyncio.run(_collect_metrics_async(token, owner, repo))
+
+        # Export based on specified format, with one shared timestamp so
+        # csv/json outputs of the same run get matching filenames
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         if args.format in ['csv', 'both']:
-            collector.export_data(metrics, args.output_dir, 'github_metrics', 'csv')
+            GitHubMetricsCollector.export_data(metrics, args.output_dir, 'github_metrics', 'csv',
+                                               timestamp=timestamp)
         if args.format in ['json', 'both']:
-            collector.export_data(metrics, args.output_dir, 'github_metrics', 'json')
-        
+            GitHubMetricsCollector.export_data(metrics, args.output_dir, 'github_metrics', 'json',
+                                               timestamp=timestamp)
+
     except RateLimitError as e:
         logger.error(f"Rate limit exceeded. Resets at {datetime.fromtimestamp(e.reset_time)}")
-    except HTTPError as e:
+    except (HTTPError, httpx.HTTPError) as e:
         logger.error(f"HTTP error occurred: {e}", exc_info=True)
     except Exception as e:
         logger.error(f"An unexpected error occurred: {e}", exc_info=True)